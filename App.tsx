@@ -211,6 +211,35 @@ const parseDownloads = (d: string) => {
     return num;
 };
 
+type IndexedApp = {
+    app: AppSuggestion;
+    name: string;
+    publisher: string;
+    nameWords: string[];
+    downloads: number;
+    releaseTime: number;
+};
+
+// Built once so each keystroke only does string matching, not re-parsing.
+const appIndex: IndexedApp[] = mockApps.map(app => ({
+    app,
+    name: app.name.toLowerCase(),
+    publisher: app.publisher.toLowerCase(),
+    nameWords: app.name.toLowerCase().split(/[^a-z0-9]+/).filter(Boolean),
+    downloads: parseDownloads(app.downloads),
+    releaseTime: new Date(app.releaseDate).getTime(),
+}));
+
+// Lower is better; -1 means no match.
+const matchRank = (entry: IndexedApp, q: string) => {
+    if (entry.name.startsWith(q)) return 0;
+    if (entry.nameWords.some(word => word.startsWith(q))) return 1;
+    if (entry.name.includes(q)) return 2;
+    if (entry.publisher.startsWith(q)) return 3;
+    if (entry.publisher.includes(q)) return 4;
+    return -1;
+};
+
 const fetchAppSuggestions = async (query: string, store: 'google' | 'apple' | 'both', sortBy: SortOption): Promise<AppSuggestion[]> => {
     await new Promise(resolve => setTimeout(resolve, 400));
     const q = query.trim();
@@ -222,22 +251,23 @@ const fetchAppSuggestions = async (query: string, store: 'google' | 'apple' | 'b
     const lowerCaseQuery = q.toLowerCase();
     
     // Filter
-    let filtered = mockApps.filter(app => {
-        const matchesStore = store === 'both' || app.store === store;
-        const matchesQuery = app.name.toLowerCase().includes(lowerCaseQuery) || 
-                             app.publisher.toLowerCase().includes(lowerCaseQuery);
-        return matchesStore && matchesQuery;
-    });
+    const matches: { entry: IndexedApp; rank: number }[] = [];
+    for (const entry of appIndex) {
+        if (store !== 'both' && entry.app.store !== store) continue;
+        const rank = matchRank(entry, lowerCaseQuery);
+        if (rank >= 0) matches.push({ entry, rank });
+    }
 
-    // Sort
-    filtered.sort((a, b) => {
-        if (sortBy === 'rating') return b.rating - a.rating;
-        if (sortBy === 'downloads') return parseDownloads(b.downloads) - parseDownloads(a.downloads);
-        if (sortBy === 'date') return new Date(b.releaseDate).getTime() - new Date(a.releaseDate).getTime();
+    // Sort by relevance first, then by the requested key
+    matches.sort((a, b) => {
+        if (a.rank !== b.rank) return a.rank - b.rank;
+        if (sortBy === 'rating') return b.entry.app.rating - a.entry.app.rating;
+        if (sortBy === 'downloads') return b.entry.downloads - a.entry.downloads;
+        if (sortBy === 'date') return b.entry.releaseTime - a.entry.releaseTime;
         return 0;
     });
 
-    return filtered.slice(0, 8);
+    return matches.slice(0, 8).map(m => m.entry.app);
 };
 
 // --- Sub-components ---